@@ -5,6 +5,7 @@
 # --------------------------------------------------------------------------
 import re
 import os
+import ast
 import click
 
 from typing import Any, Union
@@ -18,7 +19,11 @@ from fastapi_fastkit.core.exceptions import TemplateExceptions
 
 logger = getLogger(__name__)
 
-REGEX = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b"
+REGEX = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b")
+APP_PLACEHOLDER_REGEX = re.compile(r"(app_title|app_description)")
+SETUP_PLACEHOLDER_REGEX = re.compile(
+    r"<(project_name|description|author|author_email)>"
+)
 
 
 def validate_email(ctx: Context, param: Any, value: Any) -> Any:
@@ -33,7 +38,7 @@ def validate_email(ctx: Context, param: Any, value: Any) -> Any:
     :return:
     """
     try:
-        if not re.match(REGEX, value):
+        if not REGEX.match(value):
             raise ValueError(value)
         else:
             return value
@@ -62,28 +67,118 @@ def inject_project_metadata(
     main_py_path = os.path.join(target_dir, "main.py")
     setup_py_path = os.path.join(target_dir, "setup.py")
 
+    app_metadata = {
+        "app_title": f'"{project_name}"',
+        "app_description": f'"{description}"',
+    }
+    setup_metadata = {
+        "project_name": project_name,
+        "description": description,
+        "author": author,
+        "author_email": author_email,
+    }
+
     try:
-        with open(main_py_path, "r+") as f:
-            content = f.read()
-            content = content.replace("app_title", f'"{project_name}"')
-            content = content.replace("app_description", f'"{description}"')
-            f.seek(0)
-            f.write(content)
-            f.truncate()
-
-        with open(setup_py_path, "r+") as f:
-            content = f.read()
-            content = content.replace("<project_name>", project_name, 1)
-            content = content.replace("<description>", description, 1)
-            content = content.replace("<author>", author, 1)
-            content = content.replace("<author_email>", author_email, 1)
-            f.seek(0)
-            f.write(content)
-            f.truncate()
+        with open(main_py_path, "r+b") as f:
+            content, count = APP_PLACEHOLDER_REGEX.subn(
+                lambda m: app_metadata[m.group(1)], f.read().decode("utf-8")
+            )
+            if count:
+                f.seek(0)
+                f.write(content.encode("utf-8"))
+                f.truncate()
+
+        # each setup.py placeholder is filled at its first occurrence only
+        with open(setup_py_path, "r+b") as f:
+            content, count = SETUP_PLACEHOLDER_REGEX.subn(
+                lambda m: setup_metadata.pop(m.group(1), m.group(0)),
+                f.read().decode("utf-8"),
+            )
+            if count:
+                f.seek(0)
+                f.write(content.encode("utf-8"))
+                f.truncate()
     except Exception as e:
         click.echo(e)
         raise TemplateExceptions("ERROR : Having some errors with injecting metadata")
 
 
-def read_template_stack() -> Union[list, None]:
-    pass
+def read_template_stack(template_dir: str) -> Union[list[str], None]:
+    """
+    Read the dependency stack of a template from its setup.py-tpl file.
+
+    :param template_dir: Directory of the FastAPI template
+    :return: list of install_requires entries,
+             None if the template declares none or its setup.py-tpl cannot be read
+    """
+    setup_py_path = os.path.join(template_dir, "setup.py-tpl")
+
+    try:
+        with open(setup_py_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return None
+
+    install_requires = _find_install_requires(source)
+    if install_requires is None:
+        return None
+
+    dependencies = []
+    for element in install_requires.elts:
+        if not isinstance(element, ast.Constant) or not isinstance(element.value, str):
+            return None
+        dependencies.append(element.value)
+    return dependencies
+
+
+def _find_install_requires(source: bytes) -> Union[ast.List, None]:
+    """
+    Find the list literal given as install_requires, either assigned at module level
+    or passed as a keyword argument of the setup() call.
+
+    :param source: raw content of a setup.py-tpl file
+    :return: list node of install_requires, None if absent or not parsable
+    """
+    try:
+        module = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    for node in module.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        else:
+            continue
+
+        if isinstance(node.value, ast.List) and any(
+            isinstance(target, ast.Name) and target.id == "install_requires"
+            for target in targets
+        ):
+            return node.value
+
+    for call in ast.walk(module):
+        if not isinstance(call, ast.Call) or not _is_setup_call(call):
+            continue
+
+        for keyword in call.keywords:
+            if keyword.arg == "install_requires" and isinstance(
+                keyword.value, ast.List
+            ):
+                return keyword.value
+    return None
+
+
+def _is_setup_call(node: ast.Call) -> bool:
+    """
+    Check if the call node is a setup() or setuptools.setup() call.
+
+    :param node: call node of a setup.py-tpl file
+    :return: True if the called function is named setup
+    """
+    if isinstance(node.func, ast.Name):
+        return node.func.id == "setup"
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr == "setup"
+    return False
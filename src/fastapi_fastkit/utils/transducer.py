@@ -10,22 +10,6 @@ import os
 import shutil
 
 
-def _convert_tpl_to_real_extension(file_path: str) -> str:
-    """
-    Converts a file ending in `.*-tpl` to its respective file extension by removing the `-tpl` suffix.
-
-    :param file_path: The full path of the `.*-tpl` file.
-    :type file_path: str
-    :return: The new path of the file with the `-tpl` suffix removed.
-    """
-    # Remove the '-tpl' suffix from any file extension
-    if file_path.endswith("-tpl"):
-        new_file_path = file_path.replace("-tpl", "")
-        os.rename(file_path, new_file_path)
-        return new_file_path
-    return file_path
-
-
 def copy_and_convert_template(
     template_dir: str, target_dir: str, project_name: str = ""
 ) -> None:
@@ -49,8 +33,7 @@ def copy_and_convert_template(
         relative_path = os.path.relpath(root, template_dir)
         destination_dir = os.path.join(target_path, relative_path)
 
-        if not os.path.exists(destination_dir):
-            os.makedirs(destination_dir)
+        os.makedirs(destination_dir, exist_ok=True)
 
         for file in files:
             src_file = os.path.join(root, file)
@@ -58,7 +41,6 @@ def copy_and_convert_template(
             if file.endswith("-tpl"):
                 dst_file = os.path.join(destination_dir, file.replace("-tpl", ""))
                 shutil.copy2(src_file, dst_file)
-                _convert_tpl_to_real_extension(dst_file)
             else:
                 dst_file = os.path.join(destination_dir, file)
                 shutil.copy2(src_file, dst_file)
@@ -4,12 +4,16 @@
 # @author bnbong bbbong9@gmail.com
 # --------------------------------------------------------------------------
 import os
+import pytest
 
 from pathlib import Path
+from typing import Union
 
 from click.testing import CliRunner
 
+from fastapi_fastkit.backend import inject_project_metadata, read_template_stack
 from fastapi_fastkit.cli import fastkit_cli
+from fastapi_fastkit.core.settings import FastkitConfig
 
 
 class TestBackend:
@@ -38,3 +42,125 @@ class TestBackend:
         assert "running at debugging mode!!" in result.output
         assert expected_current_user_workspace in result.output
         assert expected_project_root in result.output
+
+    def test_read_template_stack(self) -> None:
+        """
+        Test that install_requires entries are read from the template's setup.py-tpl,
+        skipping comment lines.
+        """
+        # given
+        template_dir = os.path.join(
+            FastkitConfig().FASTKIT_TEMPLATE_ROOT, "fastapi-default"
+        )
+
+        # when
+        stack = read_template_stack(template_dir)
+
+        # then
+        assert stack is not None
+        assert "fastapi==0.111.1" in stack
+        assert "pytest-asyncio==0.23.8" in stack
+        assert not any(dep.startswith("#") for dep in stack)
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            (
+                b"install_requires: list[str] = [\n"
+                b"    # Main Application Dependencies\n"
+                b'    "fastapi==0.111.1",\n'
+                b'    "uvicorn==0.30.1",\n'
+                b"]\n",
+                ["fastapi==0.111.1", "uvicorn==0.30.1"],
+            ),
+            (
+                b'install_requires = ["uvicorn[standard]==0.30.1", "fastapi==0.111.1"]\n',
+                ["uvicorn[standard]==0.30.1", "fastapi==0.111.1"],
+            ),
+            (
+                b"from setuptools import setup\n"
+                b'setup(name="<project_name>", install_requires=["fastapi==0.111.1"])\n',
+                ["fastapi==0.111.1"],
+            ),
+            (b'FASTAPI = "fastapi==0.111.1"\ninstall_requires = [FASTAPI]\n', None),
+            (b"install_requires: list[str] = [1, 2]\n", None),
+            (b"install_requires = [{[]: 1}, {1, []}]\n", None),
+            (b'install_requires = ["fastapi==0.111.1", "\xff"]\n', None),
+            (b"from setuptools import setup\nsetup()\n", None),
+        ],
+        ids=[
+            "typed-with-comment",
+            "extras",
+            "setup-keyword",
+            "non-literal-entry",
+            "non-string-entries",
+            "unhashable-entries",
+            "invalid-encoding",
+            "undeclared",
+        ],
+    )
+    def test_read_template_stack_sources(
+        self, tmp_path: Path, source: bytes, expected: Union[list[str], None]
+    ) -> None:
+        # given
+        (tmp_path / "setup.py-tpl").write_bytes(source)
+
+        # when
+        stack = read_template_stack(str(tmp_path))
+
+        # then
+        assert stack == expected
+
+    def test_read_template_stack_unreadable(self, tmp_path: Path) -> None:
+        """
+        Test that templates without a readable setup.py-tpl yield no stack
+        instead of raising.
+        """
+        # given
+        template_file = tmp_path / "README.md"
+        template_file.write_text("# not a template directory\n")
+        template_with_directory = tmp_path / "directory-template"
+        (template_with_directory / "setup.py-tpl").mkdir(parents=True)
+
+        # when, then
+        assert read_template_stack(str(tmp_path)) is None
+        assert read_template_stack(str(template_file)) is None
+        assert read_template_stack(str(template_with_directory)) is None
+
+    def test_inject_project_metadata_with_repeated_placeholders(self, temp_dir) -> None:
+        """
+        Test that main.py placeholders are replaced at every occurrence while
+        each setup.py placeholder is replaced at its first occurrence only.
+        """
+        # given
+        project_dir = os.path.join(temp_dir, "repeated-placeholders")
+        os.makedirs(project_dir, exist_ok=True)
+        with open(os.path.join(project_dir, "main.py"), "w") as f:
+            f.write(
+                "app = create_app(settings, app_title, app_description)\n"
+                "docs = create_docs(app_title, app_description)\n"
+            )
+        with open(os.path.join(project_dir, "setup.py"), "w") as f:
+            f.write(
+                'setup(name="<project_name>", author="<author>", '
+                'author_email="<author_email>", description="<description>")\n'
+                "# maintained by <author> (<author_email>)\n"
+            )
+
+        # when
+        inject_project_metadata(
+            project_dir, "test-project", "bnbong", "bbbong9@gmail.com", "test project"
+        )
+
+        # then
+        with open(os.path.join(project_dir, "main.py"), "r") as f:
+            assert f.read() == (
+                'app = create_app(settings, "test-project", "test project")\n'
+                'docs = create_docs("test-project", "test project")\n'
+            )
+        with open(os.path.join(project_dir, "setup.py"), "r") as f:
+            assert f.read() == (
+                'setup(name="test-project", author="bnbong", '
+                'author_email="bbbong9@gmail.com", description="test project")\n'
+                "# maintained by <author> (<author_email>)\n"
+            )
@@ -84,6 +84,48 @@ class TestCLI:
             assert "bnbong" in setup_py_content
             assert "bbbong9@gmail.com" in setup_py_content
 
+    def test_startup_invalid_email(self, temp_dir) -> None:
+        # given
+        os.chdir(temp_dir)
+
+        # when
+        result = self.runner.invoke(
+            fastkit_cli,  # type: ignore
+            ["startup", "fastapi-default"],
+            input="\n".join(
+                [
+                    "test-project",
+                    "bnbong",
+                    "invalid-email",
+                    "bbbong9@gmail.com",
+                    "test project",
+                    "N",
+                ]
+            ),
+        )
+
+        # then
+        assert "Incorrect email address given: invalid-email" in result.output
+        assert "Author Email: bbbong9@gmail.com" in result.output
+        assert "Project creation aborted!" in result.output
+
+    def test_startup_with_template_file(self, temp_dir) -> None:
+        # given
+        os.chdir(temp_dir)
+
+        # when
+        result = self.runner.invoke(
+            fastkit_cli,  # type: ignore
+            ["startup", "README.md"],
+            input="\n".join(
+                ["test-project", "bnbong", "bbbong9@gmail.com", "test project", "N"]
+            ),
+        )
+
+        # then
+        assert result.exception is None
+        assert "Project creation aborted!" in result.output
+
     def test_deleteproject(self, temp_dir) -> None:
         # given
         os.chdir(temp_dir)